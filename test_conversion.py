@@ -6,19 +6,217 @@ Run with: python -m pytest test_conversion.py -v
 Or simply: python test_conversion.py
 """
 
+import copy
+import importlib
+import io
 import json
 import unittest
-from datetime import datetime
 
-from google_tasks_to_sp import (
-    convert_google_tasks_to_sp,
-    convert_task,
-    generate_uuid,
-    parse_iso_to_date_string,
-    parse_iso_to_unix_ms,
-    sanitize_title,
-    validate_sp_data,
-)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# The converter is imported lazily in setUpModule so plain test discovery
+# never pays for the module load; these globals are bound before any test
+# runs.
+convert_google_tasks_to_sp = None
+convert_google_tasks_stream = None
+convert_task = None
+generate_uuid = None
+parse_iso_to_date_string = None
+parse_iso_to_unix_ms = None
+sanitize_title = None
+validate_sp_data = None
+
+
+
+# All conversion inputs live in one JSON blob parsed once at import -
+# cheaper than rebuilding dict literals per test and keeps the fixtures in
+# one place. The converter never mutates its input, so read-only tests use
+# the parsed fixtures directly.
+_FIXTURES_JSON = """
+{
+  "sample": {
+    "kind": "tasks#taskLists",
+    "items": [
+      {
+        "kind": "tasks#tasks",
+        "id": "list1",
+        "title": "My Tasks",
+        "updated": "2020-10-10T03:46:42.098751Z",
+        "items": [
+          {
+            "kind": "tasks#task",
+            "id": "task1",
+            "title": "Task One",
+            "status": "needsAction",
+            "updated": "2020-10-10T03:46:42.098751Z"
+          },
+          {
+            "kind": "tasks#task",
+            "id": "task2",
+            "title": "Task Two",
+            "status": "completed",
+            "completed": "2020-10-11T10:00:00Z",
+            "updated": "2020-10-10T03:46:42.098751Z"
+          }
+        ]
+      }
+    ]
+  },
+  "empty_list": {
+    "kind": "tasks#taskLists",
+    "items": [
+      {
+        "kind": "tasks#tasks",
+        "id": "list1",
+        "title": "Empty List",
+        "updated": "2020-10-10T03:46:42.098751Z",
+        "items": []
+      }
+    ]
+  },
+  "multiple_lists": {
+    "kind": "tasks#taskLists",
+    "items": [
+      {
+        "kind": "tasks#tasks",
+        "id": "list1",
+        "title": "List One",
+        "items": [{"id": "t1", "title": "Task 1", "status": "needsAction"}]
+      },
+      {
+        "kind": "tasks#tasks",
+        "id": "list2",
+        "title": "List Two",
+        "items": [{"id": "t2", "title": "Task 2", "status": "needsAction"}]
+      }
+    ]
+  },
+  "subtasks": {
+    "kind": "tasks#taskLists",
+    "items": [
+      {
+        "kind": "tasks#tasks",
+        "id": "list1",
+        "title": "My Tasks",
+        "items": [
+          {"id": "parent_task", "title": "Parent Task", "status": "needsAction"},
+          {
+            "id": "child_task",
+            "title": "Child Task",
+            "parent": "parent_task",
+            "status": "needsAction"
+          }
+        ]
+      }
+    ]
+  },
+  "valid_single": {
+    "kind": "tasks#taskLists",
+    "items": [
+      {
+        "kind": "tasks#tasks",
+        "id": "list1",
+        "title": "My Tasks",
+        "items": [{"id": "task1", "title": "Task One", "status": "needsAction"}]
+      }
+    ]
+  },
+  "skeleton": {
+    "kind": "tasks#taskLists",
+    "items": [{"id": "list1", "title": "Test", "items": []}]
+  },
+  "unicode": {
+    "kind": "tasks#taskLists",
+    "items": [
+      {
+        "id": "list1",
+        "title": "日本語タスク",
+        "items": [
+          {"id": "t1", "title": "任務一 🎯", "status": "needsAction"},
+          {"id": "t2", "title": "Tâche française", "status": "needsAction"}
+        ]
+      }
+    ]
+  },
+  "empty": {"kind": "tasks#taskLists", "items": []},
+  "missing_title": {
+    "kind": "tasks#taskLists",
+    "items": [
+      {
+        "id": "list1",
+        "title": "My Tasks",
+        "items": [{"id": "t1", "title": "", "status": "needsAction"}]
+      }
+    ]
+  },
+  "no_id": {
+    "kind": "tasks#taskLists",
+    "items": [
+      {
+        "id": "list1",
+        "title": "My Tasks",
+        "items": [{"title": "No ID Task", "status": "needsAction"}]
+      }
+    ]
+  },
+  "duplicate_ids": {
+    "kind": "tasks#taskLists",
+    "items": [
+      {
+        "id": "list1",
+        "title": "My Tasks",
+        "items": [
+          {"id": "SAME_ID", "title": "Task One", "status": "needsAction"},
+          {"id": "SAME_ID", "title": "Task Two", "status": "needsAction"}
+        ]
+      },
+      {
+        "id": "list2",
+        "title": "Second List",
+        "items": [
+          {"id": "SAME_ID", "title": "Task Three", "status": "needsAction"},
+          {"id": "SAME_ID", "title": "Task Four", "status": "needsAction"}
+        ]
+      }
+    ]
+  }
+}
+"""
+
+FIXTURES = (orjson.loads if orjson is not None else json.loads)(_FIXTURES_JSON)
+
+
+# Shared skeleton backup for validator tests: built once per test run in
+# setUpModule and deep-copied by any test that mutates it
+EMPTY_BACKUP = None
+
+
+def setUpModule():
+    """Import the converter and build module-wide fixtures once."""
+    global convert_google_tasks_to_sp, convert_google_tasks_stream
+    global convert_task, generate_uuid
+    global parse_iso_to_date_string, parse_iso_to_unix_ms
+    global sanitize_title, validate_sp_data, EMPTY_BACKUP
+
+    mod = importlib.import_module('google_tasks_to_sp')
+    convert_google_tasks_to_sp = mod.convert_google_tasks_to_sp
+    convert_google_tasks_stream = mod.convert_google_tasks_stream
+    convert_task = mod.convert_task
+    generate_uuid = mod.generate_uuid
+    parse_iso_to_date_string = mod.parse_iso_to_date_string
+    parse_iso_to_unix_ms = mod.parse_iso_to_unix_ms
+    sanitize_title = mod.sanitize_title
+    validate_sp_data = mod.validate_sp_data
+
+    EMPTY_BACKUP = convert_google_tasks_to_sp(FIXTURES["skeleton"])
 
 
 class TestUtilityFunctions(unittest.TestCase):
@@ -50,11 +248,27 @@ class TestUtilityFunctions(unittest.TestCase):
         """Empty string should return None."""
         self.assertIsNone(parse_iso_to_unix_ms(""))
 
+    def test_parse_iso_to_unix_ms_invalid_date(self):
+        """Impossible calendar dates should warn and return None."""
+        # Fresh strings each: the parser is memoized and only warns on
+        # the first occurrence of a bad input
+        with self.assertWarns(UserWarning):
+            self.assertIsNone(parse_iso_to_unix_ms("2021-02-30T00:00:00Z"))
+        with self.assertWarns(UserWarning):
+            self.assertIsNone(parse_iso_to_unix_ms("0000-01-01T00:00:01Z"))
+
     def test_parse_iso_to_date_string_valid(self):
         """Valid ISO timestamps should extract date."""
         result = parse_iso_to_date_string("2020-10-10T03:46:42.098751Z")
         self.assertEqual(result, "2020-10-10")
 
+    def test_parse_iso_to_date_string_invalid_date(self):
+        """Impossible calendar dates should warn and return None."""
+        with self.assertWarns(UserWarning):
+            self.assertIsNone(parse_iso_to_date_string("2020-13-01T00:00:00Z"))
+        with self.assertWarns(UserWarning):
+            self.assertIsNone(parse_iso_to_date_string("2020-02-30T00:00:00Z"))
+
     def test_parse_iso_to_date_string_none(self):
         """None input should return None."""
         self.assertIsNone(parse_iso_to_date_string(None))
@@ -187,40 +401,15 @@ class TestTaskConversion(unittest.TestCase):
 class TestFullConversion(unittest.TestCase):
     """Test full conversion process."""
 
-    def setUp(self):
-        """Set up test data."""
-        self.sample_data = {
-            "kind": "tasks#taskLists",
-            "items": [
-                {
-                    "kind": "tasks#tasks",
-                    "id": "list1",
-                    "title": "My Tasks",
-                    "updated": "2020-10-10T03:46:42.098751Z",
-                    "items": [
-                        {
-                            "kind": "tasks#task",
-                            "id": "task1",
-                            "title": "Task One",
-                            "status": "needsAction",
-                            "updated": "2020-10-10T03:46:42.098751Z",
-                        },
-                        {
-                            "kind": "tasks#task",
-                            "id": "task2",
-                            "title": "Task Two",
-                            "status": "completed",
-                            "completed": "2020-10-11T10:00:00Z",
-                            "updated": "2020-10-10T03:46:42.098751Z",
-                        },
-                    ],
-                },
-            ],
-        }
+    @classmethod
+    def setUpClass(cls):
+        """Convert the shared sample data once for the whole class."""
+        cls.sample_data = FIXTURES["sample"]
+        cls.sample_result = convert_google_tasks_to_sp(cls.sample_data)
 
     def test_convert_sample_data(self):
         """Sample data should convert without errors."""
-        result = convert_google_tasks_to_sp(self.sample_data)
+        result = self.sample_result
 
         # Check CompleteBackup wrapper structure
         self.assertIn("data", result)
@@ -236,8 +425,7 @@ class TestFullConversion(unittest.TestCase):
 
     def test_project_created(self):
         """Projects should be created from task lists."""
-        result = convert_google_tasks_to_sp(self.sample_data)
-        data = result["data"]
+        data = self.sample_result["data"]
 
         project_id = data["project"]["ids"][0]
         project = data["project"]["entities"][project_id]
@@ -248,8 +436,7 @@ class TestFullConversion(unittest.TestCase):
 
     def test_tasks_linked_to_project(self):
         """Tasks should be linked to their project."""
-        result = convert_google_tasks_to_sp(self.sample_data)
-        data = result["data"]
+        data = self.sample_result["data"]
 
         project_id = data["project"]["ids"][0]
 
@@ -259,20 +446,7 @@ class TestFullConversion(unittest.TestCase):
 
     def test_empty_task_list(self):
         """Empty task lists should create empty projects."""
-        input_data = {
-            "kind": "tasks#taskLists",
-            "items": [
-                {
-                    "kind": "tasks#tasks",
-                    "id": "list1",
-                    "title": "Empty List",
-                    "updated": "2020-10-10T03:46:42.098751Z",
-                    "items": [],
-                },
-            ],
-        }
-
-        result = convert_google_tasks_to_sp(input_data)
+        result = convert_google_tasks_to_sp(FIXTURES["empty_list"])
         data = result["data"]
 
         self.assertEqual(len(data["project"]["ids"]), 1)
@@ -284,25 +458,7 @@ class TestFullConversion(unittest.TestCase):
 
     def test_multiple_task_lists(self):
         """Multiple task lists should create multiple projects."""
-        input_data = {
-            "kind": "tasks#taskLists",
-            "items": [
-                {
-                    "kind": "tasks#tasks",
-                    "id": "list1",
-                    "title": "List One",
-                    "items": [{"id": "t1", "title": "Task 1", "status": "needsAction"}],
-                },
-                {
-                    "kind": "tasks#tasks",
-                    "id": "list2",
-                    "title": "List Two",
-                    "items": [{"id": "t2", "title": "Task 2", "status": "needsAction"}],
-                },
-            ],
-        }
-
-        result = convert_google_tasks_to_sp(input_data)
+        result = convert_google_tasks_to_sp(FIXTURES["multiple_lists"])
         data = result["data"]
 
         self.assertEqual(len(data["project"]["ids"]), 2)
@@ -314,31 +470,7 @@ class TestSubtasks(unittest.TestCase):
 
     def test_subtask_relationships(self):
         """Subtasks should be properly linked to parents."""
-        input_data = {
-            "kind": "tasks#taskLists",
-            "items": [
-                {
-                    "kind": "tasks#tasks",
-                    "id": "list1",
-                    "title": "My Tasks",
-                    "items": [
-                        {
-                            "id": "parent_task",
-                            "title": "Parent Task",
-                            "status": "needsAction",
-                        },
-                        {
-                            "id": "child_task",
-                            "title": "Child Task",
-                            "parent": "parent_task",
-                            "status": "needsAction",
-                        },
-                    ],
-                },
-            ],
-        }
-
-        result = convert_google_tasks_to_sp(input_data)
+        result = convert_google_tasks_to_sp(FIXTURES["subtasks"])
         data = result["data"]
 
         # Find parent and child tasks
@@ -361,31 +493,7 @@ class TestSubtasks(unittest.TestCase):
 
     def test_subtasks_not_in_project_taskids(self):
         """Subtasks should not appear in project.taskIds."""
-        input_data = {
-            "kind": "tasks#taskLists",
-            "items": [
-                {
-                    "kind": "tasks#tasks",
-                    "id": "list1",
-                    "title": "My Tasks",
-                    "items": [
-                        {
-                            "id": "parent_task",
-                            "title": "Parent Task",
-                            "status": "needsAction",
-                        },
-                        {
-                            "id": "child_task",
-                            "title": "Child Task",
-                            "parent": "parent_task",
-                            "status": "needsAction",
-                        },
-                    ],
-                },
-            ],
-        }
-
-        result = convert_google_tasks_to_sp(input_data)
+        result = convert_google_tasks_to_sp(FIXTURES["subtasks"])
         data = result["data"]
 
         project_id = data["project"]["ids"][0]
@@ -408,31 +516,14 @@ class TestValidation(unittest.TestCase):
 
     def test_valid_data_passes(self):
         """Valid data should pass validation."""
-        input_data = {
-            "kind": "tasks#taskLists",
-            "items": [
-                {
-                    "kind": "tasks#tasks",
-                    "id": "list1",
-                    "title": "My Tasks",
-                    "items": [
-                        {"id": "task1", "title": "Task One", "status": "needsAction"},
-                    ],
-                },
-            ],
-        }
-
-        result = convert_google_tasks_to_sp(input_data)
+        result = convert_google_tasks_to_sp(FIXTURES["valid_single"])
         errors = validate_sp_data(result)
 
         self.assertEqual(errors, [])
 
     def test_detect_invalid_project_reference(self):
         """Invalid project references should be detected."""
-        backup = convert_google_tasks_to_sp({
-            "kind": "tasks#taskLists",
-            "items": [{"id": "list1", "title": "Test", "items": []}],
-        })
+        backup = copy.deepcopy(EMPTY_BACKUP)
         data = backup["data"]
 
         # Manually corrupt data
@@ -450,10 +541,7 @@ class TestValidation(unittest.TestCase):
 
     def test_detect_circular_reference(self):
         """Circular parent references should be detected."""
-        backup = convert_google_tasks_to_sp({
-            "kind": "tasks#taskLists",
-            "items": [{"id": "list1", "title": "Test", "items": []}],
-        })
+        backup = copy.deepcopy(EMPTY_BACKUP)
         data = backup["data"]
 
         # Create circular reference
@@ -487,28 +575,14 @@ class TestUnicode(unittest.TestCase):
 
     def test_unicode_titles(self):
         """Unicode titles should be preserved."""
-        input_data = {
-            "kind": "tasks#taskLists",
-            "items": [
-                {
-                    "id": "list1",
-                    "title": "日本語タスク",
-                    "items": [
-                        {"id": "t1", "title": "任務一 🎯", "status": "needsAction"},
-                        {"id": "t2", "title": "Tâche française", "status": "needsAction"},
-                    ],
-                },
-            ],
-        }
-
-        result = convert_google_tasks_to_sp(input_data)
+        result = convert_google_tasks_to_sp(FIXTURES["unicode"])
         data = result["data"]
 
         project_id = data["project"]["ids"][0]
         project = data["project"]["entities"][project_id]
         self.assertEqual(project["title"], "日本語タスク")
 
-        titles = [t["title"] for t in data["task"]["entities"].values()]
+        titles = {t["title"] for t in data["task"]["entities"].values()}
         self.assertIn("任務一 🎯", titles)
         self.assertIn("Tâche française", titles)
 
@@ -518,8 +592,7 @@ class TestEdgeCases(unittest.TestCase):
 
     def test_empty_input(self):
         """Empty items array should work."""
-        input_data = {"kind": "tasks#taskLists", "items": []}
-        result = convert_google_tasks_to_sp(input_data)
+        result = convert_google_tasks_to_sp(FIXTURES["empty"])
         data = result["data"]
 
         self.assertEqual(len(data["project"]["ids"]), 0)
@@ -527,68 +600,24 @@ class TestEdgeCases(unittest.TestCase):
 
     def test_missing_task_title(self):
         """Missing task title should become 'Untitled Task'."""
-        input_data = {
-            "kind": "tasks#taskLists",
-            "items": [
-                {
-                    "id": "list1",
-                    "title": "My Tasks",
-                    "items": [{"id": "t1", "title": "", "status": "needsAction"}],
-                },
-            ],
-        }
-
-        result = convert_google_tasks_to_sp(input_data)
+        result = convert_google_tasks_to_sp(FIXTURES["missing_title"])
         data = result["data"]
 
-        task = list(data["task"]["entities"].values())[0]
+        task = next(iter(data["task"]["entities"].values()))
         self.assertEqual(task["title"], "Untitled Task")
 
     def test_task_without_id(self):
         """Tasks without IDs should still get UUIDs."""
-        input_data = {
-            "kind": "tasks#taskLists",
-            "items": [
-                {
-                    "id": "list1",
-                    "title": "My Tasks",
-                    "items": [{"title": "No ID Task", "status": "needsAction"}],
-                },
-            ],
-        }
-
-        result = convert_google_tasks_to_sp(input_data)
+        result = convert_google_tasks_to_sp(FIXTURES["no_id"])
         data = result["data"]
 
         self.assertEqual(len(data["task"]["ids"]), 1)
-        task = list(data["task"]["entities"].values())[0]
+        task = next(iter(data["task"]["entities"].values()))
         self.assertTrue(len(task["id"]) > 0)
 
     def test_duplicate_task_ids(self):
         """Tasks with duplicate IDs should each get unique UUIDs."""
-        input_data = {
-            "kind": "tasks#taskLists",
-            "items": [
-                {
-                    "id": "list1",
-                    "title": "My Tasks",
-                    "items": [
-                        {"id": "SAME_ID", "title": "Task One", "status": "needsAction"},
-                        {"id": "SAME_ID", "title": "Task Two", "status": "needsAction"},
-                    ],
-                },
-                {
-                    "id": "list2",
-                    "title": "Second List",
-                    "items": [
-                        {"id": "SAME_ID", "title": "Task Three", "status": "needsAction"},
-                        {"id": "SAME_ID", "title": "Task Four", "status": "needsAction"},
-                    ],
-                },
-            ],
-        }
-
-        result = convert_google_tasks_to_sp(input_data)
+        result = convert_google_tasks_to_sp(FIXTURES["duplicate_ids"])
         data = result["data"]
 
         # Should have 4 unique tasks despite duplicate original IDs
@@ -600,7 +629,7 @@ class TestEdgeCases(unittest.TestCase):
         self.assertEqual(len(task_ids), len(set(task_ids)))
 
         # All titles should be present
-        titles = [t["title"] for t in data["task"]["entities"].values()]
+        titles = {t["title"] for t in data["task"]["entities"].values()}
         self.assertIn("Task One", titles)
         self.assertIn("Task Two", titles)
         self.assertIn("Task Three", titles)
@@ -611,6 +640,107 @@ class TestEdgeCases(unittest.TestCase):
         self.assertEqual(errors, [])
 
 
+class TestParallelConversion(unittest.TestCase):
+    """Test the --jobs multiprocess conversion path."""
+
+    def test_parallel_jobs_unique_ids(self):
+        """Forked workers must not replay the parent's entropy pool."""
+        # Partially consume the parent's pool so children inherit a
+        # mid-stream state, then convert twice in one process - the
+        # regression produced colliding UUIDs that dict.update silently
+        # merged away
+        generate_uuid()
+
+        lists = [
+            {"id": f"l{i}", "title": f"List {i}", "items": [
+                {"id": f"t{i}", "title": f"Task {i}", "status": "needsAction"},
+            ]}
+            for i in range(8)
+        ]
+        input_data = {"kind": "tasks#taskLists", "items": lists}
+
+        seen_ids = set()
+        for _ in range(2):
+            result = convert_google_tasks_to_sp(input_data, jobs=2)
+            data = result["data"]
+
+            self.assertEqual(len(data["project"]["ids"]), 8)
+            self.assertEqual(len(data["task"]["ids"]), 8)
+            self.assertEqual(validate_sp_data(result), [])
+
+            run_ids = set(data["project"]["ids"]) | set(data["task"]["ids"])
+            self.assertEqual(len(run_ids), 16)
+            # No collisions across runs either
+            self.assertFalse(seen_ids & run_ids)
+            seen_ids |= run_ids
+
+
+    def test_parallel_duplicate_parent_across_shards(self):
+        """Parent links must match serial semantics for cross-shard duplicate IDs."""
+        # 'SAME' first occurs in shard one; a duplicate plus a child
+        # referencing it sit in the last list. Workers wire the child to
+        # their shard-local duplicate, so the merge must re-resolve it to
+        # the global first occurrence like the serial path does
+        input_data = {"kind": "tasks#taskLists", "items": [
+            {"id": "l0", "title": "L0", "items": [
+                {"id": "SAME", "title": "First", "status": "needsAction"},
+            ]},
+            {"id": "l1", "title": "L1", "items": [
+                {"id": "x1", "title": "X1", "status": "needsAction"},
+            ]},
+            {"id": "l2", "title": "L2", "items": [
+                {"id": "x2", "title": "X2", "status": "needsAction"},
+            ]},
+            {"id": "l3", "title": "L3", "items": [
+                {"id": "SAME", "title": "Dup", "status": "needsAction"},
+                {"id": "c", "title": "Child", "parent": "SAME", "status": "needsAction"},
+            ]},
+        ]}
+
+        for jobs in (1, 2):
+            result = convert_google_tasks_to_sp(input_data, jobs=jobs)
+            entities = result["data"]["task"]["entities"]
+            by_title = {t["title"]: t for t in entities.values()}
+
+            parent = entities[by_title["Child"]["parentId"]]
+            self.assertEqual(parent["title"], "First")
+            self.assertIn(by_title["Child"]["id"], by_title["First"]["subTaskIds"])
+            self.assertEqual(by_title["Dup"]["subTaskIds"], [])
+            self.assertEqual(validate_sp_data(result), [])
+
+
+class TestStreamingConversion(unittest.TestCase):
+    """Test the ijson streaming entry point."""
+
+    @unittest.skipIf(ijson is None, "ijson not installed")
+    def test_stream_matches_dict_path(self):
+        """Streaming conversion should match the dict-based path structurally."""
+        raw = json.dumps(FIXTURES["subtasks"]).encode("utf-8")
+        streamed = convert_google_tasks_stream(io.BytesIO(raw))
+        direct = convert_google_tasks_to_sp(FIXTURES["subtasks"])
+
+        self.assertEqual(validate_sp_data(streamed), [])
+
+        def summarize(result):
+            """Project/task/parent structure by title (IDs differ per run)."""
+            data = result["data"]
+            entities = data["task"]["entities"]
+            projects = {
+                p["title"]: sorted(
+                    entities[tid]["title"] for tid in p["taskIds"]
+                )
+                for p in data["project"]["entities"].values()
+            }
+            parents = {
+                t["title"]: entities[t["parentId"]]["title"]
+                for t in entities.values()
+                if t.get("parentId") is not None
+            }
+            return projects, parents, len(data["task"]["ids"])
+
+        self.assertEqual(summarize(streamed), summarize(direct))
+
+
 def run_tests():
     """Run all tests."""
     unittest.main(verbosity=2)